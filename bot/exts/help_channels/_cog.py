@@ -1,5 +1,6 @@
 """Contains the Cog that receives discord.py events and defers most actions to other files in the module."""
 
+import asyncio
 import contextlib
 
 import discord
@@ -14,6 +15,12 @@ from bot.utils.checks import has_any_role_check
 
 log = get_logger(__name__)
 
+# The maximum number of open posts to check for idleness at the same time.
+MAX_CONCURRENT_POST_CHECKS = 10
+
+# Seconds after a post is opened before the first check for whether it is idle.
+NEW_POST_IDLE_CHECK_DELAY = min(constants.HelpChannels.deleted_idle_minutes, constants.HelpChannels.idle_minutes) * 60
+
 
 class HelpForum(commands.Cog):
     """
@@ -29,6 +36,8 @@ class HelpForum(commands.Cog):
         self.bot = bot
         self.scheduler = scheduling.Scheduler(self.__class__.__name__)
         self.help_forum_channel: discord.ForumChannel = None
+        # IDs of open posts already marked in `_caches.posts_with_non_claimant_messages`.
+        self._marked_posts: set[int] = set()
 
     async def cog_unload(self) -> None:
         """Cancel all scheduled tasks on unload."""
@@ -40,14 +49,21 @@ class HelpForum(commands.Cog):
         self.help_forum_channel = self.bot.get_channel(constants.Channels.python_help)
         if not isinstance(self.help_forum_channel, discord.ForumChannel):
             raise TypeError("Channels.python_help is not a forum channel!")
+        self._help_forum_id: int = self.help_forum_channel.id
         self.check_all_open_posts_have_close_task.start()
 
     @tasks.loop(minutes=5)
     async def check_all_open_posts_have_close_task(self) -> None:
         """Check that each open help post has a scheduled task to close, adding one if not."""
-        for post in self.help_forum_channel.threads:
-            if post.id not in self.scheduler:
-                await _channel.maybe_archive_idle_post(post.id, self.scheduler)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_POST_CHECKS)
+
+        async def check_post(post_id: int) -> None:
+            async with semaphore:
+                await _channel.maybe_archive_idle_post(post_id, self.scheduler)
+
+        await asyncio.gather(
+            *(check_post(post.id) for post in self.help_forum_channel.threads if post.id not in self.scheduler)
+        )
 
     async def close_check(self, ctx: commands.Context) -> bool:
         """Return True if the channel is a help post, and the user is the claimant or has a whitelisted role."""
@@ -81,6 +97,7 @@ class HelpForum(commands.Cog):
         # Don't use a discord.py check because the check needs to fail silently.
         if await self.close_check(ctx):
             log.info(f"Close command invoked by {ctx.author} in #{ctx.channel}.")
+            self._marked_posts.discard(ctx.channel.id)
             await _channel.help_post_closed(ctx.channel, self.scheduler)
 
     @help_forum_group.command(name="title", root_aliases=("title",))
@@ -99,22 +116,21 @@ class HelpForum(commands.Cog):
     @commands.Cog.listener("on_message")
     async def new_post_listener(self, message: discord.Message) -> None:
         """Defer application of new post logic for posts in the help forum to the _channel helper."""
-        if not isinstance(message.channel, discord.Thread):
-            return
         thread = message.channel
+        if not isinstance(thread, discord.Thread) or thread.parent_id != self._help_forum_id:
+            return
 
         if message.id != thread.id:
             # Opener messages have the same ID as the thread
             return
 
-        if thread.parent_id != self.help_forum_channel.id:
-            return
-
         await _channel.help_post_opened(thread, scheduler=self.scheduler)
 
-        delay = min(constants.HelpChannels.deleted_idle_minutes, constants.HelpChannels.idle_minutes) * 60
+        if thread.id in self.scheduler:
+            return
+
         self.scheduler.schedule_later(
-            delay,
+            NEW_POST_IDLE_CHECK_DELAY,
             thread.id,
             _channel.maybe_archive_idle_post(thread.id, self.scheduler)
         )
@@ -122,9 +138,10 @@ class HelpForum(commands.Cog):
     @commands.Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread) -> None:
         """Defer application archive logic for posts in the help forum to the _channel helper."""
-        if after.parent_id != self.help_forum_channel.id:
+        if after.parent_id != self._help_forum_id:
             return
         if not before.archived and after.archived:
+            self._marked_posts.discard(after.id)
             await _channel.help_post_archived(after, self.scheduler)
             if after.id in self.scheduler:
                 self.scheduler.cancel(after.id)
@@ -132,17 +149,23 @@ class HelpForum(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_thread_delete(self, deleted_thread_event: discord.RawThreadDeleteEvent) -> None:
         """Defer application of deleted post logic for posts in the help forum to the _channel helper."""
-        if deleted_thread_event.parent_id == self.help_forum_channel.id:
+        if deleted_thread_event.parent_id == self._help_forum_id:
+            self._marked_posts.discard(deleted_thread_event.thread_id)
             await _channel.help_post_deleted(deleted_thread_event)
 
     @commands.Cog.listener("on_message")
     async def new_post_message_listener(self, message: discord.Message) -> None:
         """Defer application of new message logic for messages in the help forum to the _message helper."""
-        if not _channel.is_help_forum_post(message.channel):
+        if message.author.bot:
+            return
+
+        channel = message.channel
+        if not isinstance(channel, discord.Thread) or channel.parent_id != self._help_forum_id:
             return
 
-        if not message.author.bot and message.author.id != message.channel.owner_id:
-            await _caches.posts_with_non_claimant_messages.set(message.channel.id, "sentinel")
+        if message.author.id != channel.owner_id and channel.id not in self._marked_posts:
+            await _caches.posts_with_non_claimant_messages.set(channel.id, "sentinel")
+            self._marked_posts.add(channel.id)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
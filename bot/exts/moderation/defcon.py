@@ -1,7 +1,7 @@
 import asyncio
 import traceback
-from collections import namedtuple
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum
 
 import arrow
@@ -35,17 +35,31 @@ Even so, thanks for joining! We're very excited at the possibility of having you
 will be resolved soon. In the meantime, please feel free to peruse the resources on our site at
 <https://pythondiscord.com/>, and have a nice day!
 """
+# Split around the mention up front, so rejecting a user during a raid is a plain concatenation.
+REJECTION_MESSAGE_PREFIX, REJECTION_MESSAGE_SUFFIX = REJECTION_MESSAGE.split("{user}")
 
 BASE_CHANNEL_TOPIC = "Python Discord Defense Mechanism"
 
 SECONDS_IN_DAY = 86400
+ZERO_THRESHOLD = relativedelta(days=0)
+
+# The relativedelta attributes and the `DurationDelta` symbols they are written out with.
+_DURATION_UNITS = (("years", "y"), ("months", "m"), ("days", "d"), ("hours", "h"), ("minutes", "M"), ("seconds", "s"))
+
+
+@dataclass(frozen=True, slots=True)
+class ActionInfo:
+    """The details used when reporting a DEFCON action."""
+
+    icon: str
+    emoji: str
+    color: Colour | int
+    template: str
 
 
 class Action(Enum):
     """Defcon Action."""
 
-    ActionInfo = namedtuple("LogInfoDetails", ["icon", "emoji", "color", "template"])
-
     SERVER_OPEN = ActionInfo(Icons.defcon_unshutdown, Emojis.defcon_unshutdown, Colours.soft_green, "")
     SERVER_SHUTDOWN = ActionInfo(Icons.defcon_shutdown, Emojis.defcon_shutdown, Colours.soft_red, "")
     DURATION_UPDATE = ActionInfo(
@@ -64,12 +78,18 @@ class Defcon(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.channel = None
-        self.threshold = relativedelta(days=0)
-        self.expiry = None
+        self._set_threshold(ZERO_THRESHOLD)
+        self._set_expiry(None)
+        # Whether the current threshold and expiry are known to be stored in Redis.
+        self._settings_persisted = False
+        self._channel_topic = None
+        self._topic_task = None
 
         self.scheduler = Scheduler(self.__class__.__name__)
 
-        scheduling.create_task(self._sync_settings(), event_loop=self.bot.loop)
+    async def cog_load(self) -> None:
+        """Synchronize the DEFCON settings once the cog is loaded."""
+        await self._sync_settings()
 
     async def get_mod_log(self) -> ModLog:
         """Get currently loaded ModLog cog instance."""
@@ -84,13 +104,15 @@ class Defcon(Cog):
         await self.bot.wait_until_guild_available()
 
         self.channel = await self.bot.fetch_channel(Channels.defcon)
+        self._channel_topic = self.channel.topic
 
         log.trace("Syncing settings.")
 
         try:
-            settings = await self.defcon_settings.to_dict()
-            self.threshold = time.parse_duration_string(settings["threshold"]) if settings.get("threshold") else None
-            self.expiry = datetime.fromisoformat(settings["expiry"]) if settings.get("expiry") else None
+            threshold = await self.defcon_settings.get("threshold")
+            expiry = await self.defcon_settings.get("expiry")
+            self._set_threshold(time.parse_duration_string(threshold) if threshold else None)
+            self._set_expiry(datetime.fromisoformat(expiry) if expiry else None)
         except RedisError:
             log.exception("Unable to get DEFCON settings!")
             await self.channel.send(
@@ -99,52 +121,50 @@ class Defcon(Cog):
             )
 
         else:
+            self._settings_persisted = True
             if self.expiry:
                 self.scheduler.schedule_at(self.expiry, 0, self._remove_threshold())
 
             self._update_notifier()
-            log.info(f"DEFCON synchronized: {time.humanize_delta(self.threshold) if self.threshold else '-'}")
+            log.info(f"DEFCON synchronized: {self._threshold_human}")
 
         await self._update_channel_topic()
 
     @Cog.listener()
     async def on_member_join(self, member: Member) -> None:
         """Check newly joining users to see if they meet the account age threshold."""
-        if self.threshold:
-            now = arrow.utcnow()
+        if self._threshold_active and arrow.utcnow() - member.created_at < self._threshold_td:
+            log.info(f"Rejecting user {member}: Account is too new")
 
-            if now - member.created_at < time.relativedelta_to_timedelta(self.threshold):
-                log.info(f"Rejecting user {member}: Account is too new")
+            message_sent = False
 
-                message_sent = False
+            try:
+                await member.send(REJECTION_MESSAGE_PREFIX + member.mention + REJECTION_MESSAGE_SUFFIX)
+                message_sent = True
+            except Forbidden:
+                log.debug(f"Cannot send DEFCON rejection DM to {member}: DMs disabled")
+            except Exception:
+                # Broadly catch exceptions because DM isn't critical, but it's imperative to kick them.
+                log.exception(f"Error sending DEFCON rejection message to {member}")
 
-                try:
-                    await member.send(REJECTION_MESSAGE.format(user=member.mention))
-                    message_sent = True
-                except Forbidden:
-                    log.debug(f"Cannot send DEFCON rejection DM to {member}: DMs disabled")
-                except Exception:
-                    # Broadly catch exceptions because DM isn't critical, but it's imperative to kick them.
-                    log.exception(f"Error sending DEFCON rejection message to {member}")
+            await member.kick(reason="DEFCON active, user is too new")
+            self.bot.stats.incr("defcon.leaves")
 
-                await member.kick(reason="DEFCON active, user is too new")
-                self.bot.stats.incr("defcon.leaves")
-
-                message = (
-                    f"{format_user(member)} was denied entry because their account is too new."
-                )
+            message = (
+                f"{format_user(member)} was denied entry because their account is too new."
+            )
 
-                if not message_sent:
-                    message = f"{message}\n\nUnable to send rejection message via DM; they probably have DMs disabled."
+            if not message_sent:
+                message = f"{message}\n\nUnable to send rejection message via DM; they probably have DMs disabled."
 
-                await send_log_message(
-                    self.bot,
-                    Icons.defcon_denied,
-                    Colours.soft_red,
-                    "Entry denied",
-                    message,
-                    thumbnail=member.display_avatar.url
-                )
+            await send_log_message(
+                self.bot,
+                Icons.defcon_denied,
+                Colours.soft_red,
+                "Entry denied",
+                message,
+                thumbnail=member.display_avatar.url
+            )
 
     @group(name="defcon", aliases=("dc",), invoke_without_command=True)
     @has_any_role(*MODERATION_ROLES)
@@ -156,12 +176,11 @@ class Defcon(Cog):
     @has_any_role(*MODERATION_ROLES)
     async def status(self, ctx: Context) -> None:
         """Check the current status of DEFCON mode."""
-        expiry = time.format_relative(self.expiry) if self.expiry else "-"
         embed = Embed(
             colour=Colour.og_blurple(), title="DEFCON Status",
             description=f"""
-                **Threshold:** {time.humanize_delta(self.threshold) if self.threshold else "-"}
-                **Expires:** {expiry}
+                **Threshold:** {self._threshold_human}
+                **Expires:** {self._expiry_formatted}
                 **Verification level:** {ctx.guild.verification_level.name}
                 """
         )
@@ -219,11 +238,22 @@ class Defcon(Cog):
 
     async def _update_channel_topic(self) -> None:
         """Update the #defcon channel topic with the current DEFCON status."""
-        threshold = time.humanize_delta(self.threshold) if self.threshold else "-"
-        new_topic = f"{BASE_CHANNEL_TOPIC}\n(Threshold: {threshold})"
+        # Only the latest topic matters, so drop any edit which is still waiting on the ratelimit.
+        # It may already have reached Discord, so the channel's topic is unknown until the next edit goes through.
+        if self._topic_task and not self._topic_task.done():
+            self._topic_task.cancel()
+            self._channel_topic = None
+
+        if self._topic == self._channel_topic:
+            return
 
         (await self.get_mod_log()).ignore(Event.guild_channel_update, Channels.defcon)
-        scheduling.create_task(self.channel.edit(topic=new_topic))
+        self._topic_task = scheduling.create_task(self._edit_channel_topic(self._topic))
+
+    async def _edit_channel_topic(self, topic: str) -> None:
+        """Edit the #defcon channel topic, and remember it once the edit has gone through."""
+        await self.channel.edit(topic=topic)
+        self._channel_topic = topic
 
     @defcon_settings.atomic_transaction
     async def _update_threshold(
@@ -234,10 +264,20 @@ class Defcon(Cog):
         expiry: Expiry | None = None
     ) -> None:
         """Update the new threshold in the cog, cache, defcon channel, and logs, and additionally schedule expiry."""
-        self.threshold = threshold
-        if threshold == relativedelta(days=0):  # If the threshold is 0, we don't need to schedule anything
+        if threshold == ZERO_THRESHOLD:  # If the threshold is 0, we don't need to schedule anything
             expiry = None
-        self.expiry = expiry
+
+        unchanged = threshold == (self.threshold or ZERO_THRESHOLD) and expiry == self.expiry
+        # A failed write to Redis is retried by running the same update again, so only skip it if it was stored.
+        if unchanged and self._settings_persisted:
+            log.debug("DEFCON threshold and expiry are unchanged, skipping the update.")
+            if author != self.bot.user:
+                await channel.send(":x: DEFCON is already set to that threshold.")
+            return
+
+        now = arrow.utcnow()
+        self._set_threshold(threshold)
+        self._set_expiry(expiry)
 
         # Either way, we cancel the old task.
         self.scheduler.cancel_all()
@@ -255,45 +295,61 @@ class Defcon(Cog):
                     "expiry": expiry.isoformat() if expiry else 0
                 }
             )
+            self._settings_persisted = True
         except RedisError:
+            self._settings_persisted = False
             error = ", but failed to write to cache"
 
         action = Action.DURATION_UPDATE
 
         expiry_message = ""
         if expiry:
-            formatted_expiry = time.humanize_delta(expiry, max_units=2)
+            formatted_expiry = time.humanize_delta(expiry, now, max_units=2)
             expiry_message = f" for the next {formatted_expiry}"
 
         if self.threshold:
             channel_message = (
-                f"updated; accounts must be {time.humanize_delta(self.threshold)} "
+                f"updated; accounts must be {self._threshold_human} "
                 f"old to join the server{expiry_message}"
             )
         else:
             channel_message = "removed"
 
         message = f"{action.value.emoji} DEFCON threshold {channel_message}{error}."
-        await self.channel.send(message)
+        # These go to different channels, so there's no need to wait for one before sending the next.
+        sends = [self.channel.send(message), self._send_defcon_log(action, author)]
 
         # If invoked outside of #defcon send to `ctx.channel` too
         if channel != self.channel:
-            await channel.send(message)
+            sends.append(channel.send(message))
 
-        await self._send_defcon_log(action, author)
+        await asyncio.gather(*sends)
         await self._update_channel_topic()
 
         self._log_threshold_stat(threshold)
 
+    def _set_threshold(self, threshold: relativedelta | None) -> None:
+        """Set the threshold and cache the values derived from it."""
+        self.threshold = threshold
+        self._threshold_td = time.relativedelta_to_timedelta(threshold) if threshold else timedelta(0)
+        self._threshold_active = self._threshold_td.total_seconds() > 0
+        self._threshold_human = time.humanize_delta(threshold) if threshold else "-"
+        self._topic = f"{BASE_CHANNEL_TOPIC}\n(Threshold: {self._threshold_human})"
+
+    def _set_expiry(self, expiry: datetime | None) -> None:
+        """Set the expiry and cache its formatted relative timestamp for the status command."""
+        self.expiry = expiry
+        self._expiry_formatted = time.format_relative(expiry) if expiry else "-"
+
     async def _remove_threshold(self) -> None:
         """Resets the threshold back to 0."""
-        await self._update_threshold(self.bot.user, self.channel, relativedelta(days=0))
+        await self._update_threshold(self.bot.user, self.channel, ZERO_THRESHOLD)
 
     @staticmethod
     def _stringify_relativedelta(delta: relativedelta) -> str:
         """Convert a relativedelta object to a duration string."""
-        units = [("years", "y"), ("months", "m"), ("days", "d"), ("hours", "h"), ("minutes", "m"), ("seconds", "s")]
-        return "".join(f"{getattr(delta, unit)}{symbol}" for unit, symbol in units if getattr(delta, unit)) or "0s"
+        parts = [f"{value}{symbol}" for unit, symbol in _DURATION_UNITS if (value := getattr(delta, unit))]
+        return "".join(parts) or "0s"
 
     def _log_threshold_stat(self, threshold: relativedelta) -> None:
         """Adds the threshold to the bot stats in days."""
@@ -305,7 +361,7 @@ class Defcon(Cog):
         info = action.value
         log_msg: str = (
             f"**Staffer:** {actor.mention} {actor} (`{actor.id}`)\n"
-            f"{info.template.format(threshold=(time.humanize_delta(self.threshold) if self.threshold else '-'))}"
+            f"{info.template.format(threshold=self._threshold_human)}"
         )
         status_msg = f"DEFCON {action.name.lower()}"
 
@@ -313,18 +369,22 @@ class Defcon(Cog):
 
     def _update_notifier(self) -> None:
         """Start or stop the notifier according to the DEFCON status."""
-        if self.threshold and self.expiry is None and not self.defcon_notifier.is_running():
+        should_run = self._threshold_active and self.expiry is None
+        if should_run == self.defcon_notifier.is_running():
+            # Leave a running notifier alone so its hourly cadence isn't reset.
+            return
+
+        if should_run:
             log.info("DEFCON notifier started.")
             self.defcon_notifier.start()
-
-        elif (not self.threshold or self.expiry is not None) and self.defcon_notifier.is_running():
+        else:
             log.info("DEFCON notifier stopped.")
             self.defcon_notifier.cancel()
 
     @tasks.loop(hours=1)
     async def defcon_notifier(self) -> None:
         """Routinely notify moderators that DEFCON is active."""
-        await self.channel.send(f"Defcon is on and is set to {time.humanize_delta(self.threshold)}.")
+        await self.channel.send(f"Defcon is on and is set to {self._threshold_human}.")
 
     async def cog_unload(self) -> None:
         """Cancel the notifer and threshold removal tasks when the cog unloads."""
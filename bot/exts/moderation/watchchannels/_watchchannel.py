@@ -3,6 +3,7 @@ import re
 import textwrap
 from abc import abstractmethod
 from collections import defaultdict, deque
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,6 +29,9 @@ log = get_logger(__name__)
 
 URL_RE = re.compile(r"(https?://[^\s]+)")
 
+# Seconds for which the watched user cache is considered up to date after being fetched from the API.
+USER_CACHE_TTL = 5 * 60
+
 
 @dataclass
 class MessageHistory:
@@ -48,7 +52,7 @@ class WatchChannel(metaclass=CogABCMeta):
         destination: int,
         webhook_id: int,
         api_endpoint: str,
-        api_default_params: dict,
+        api_default_params: Mapping[str, str | int],
         logger: CustomLogger,
         *,
         disable_header: bool = False
@@ -62,7 +66,8 @@ class WatchChannel(metaclass=CogABCMeta):
         self.log = logger  # Logger of the child cog for a correct name in the logs
 
         self._consume_task = None
-        self.watched_users = {}
+        self.watched_users: dict[int, dict] = {}  # Keyed by user ID
+        self._user_cache_fetched_at = None
         self.message_queue = defaultdict(lambda: defaultdict(deque))
         self.consumption_queue = {}
         self.retries = 5
@@ -89,6 +94,13 @@ class WatchChannel(metaclass=CogABCMeta):
 
         return True
 
+    @property
+    def user_cache_is_fresh(self) -> bool:
+        """Checks if the watched user cache was fetched from the API within the last `USER_CACHE_TTL` seconds."""
+        if self._user_cache_fetched_at is None:
+            return False
+        return asyncio.get_running_loop().time() - self._user_cache_fetched_at < USER_CACHE_TTL
+
     async def cog_load(self) -> None:
         """Starts the watch channel by getting the channel, webhook, and user cache ready."""
         await self.bot.wait_until_guild_available()
@@ -160,6 +172,7 @@ class WatchChannel(metaclass=CogABCMeta):
             user_id = entry.pop("user")
             self.watched_users[user_id] = entry
 
+        self._user_cache_fetched_at = asyncio.get_running_loop().time()
         return True
 
     @Cog.listener()
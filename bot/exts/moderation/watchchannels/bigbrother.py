@@ -1,5 +1,5 @@
 import textwrap
-from collections import ChainMap
+from types import MappingProxyType
 
 from discord.ext.commands import Cog, Context, group, has_any_role
 
@@ -12,6 +12,8 @@ from bot.log import get_logger
 
 log = get_logger(__name__)
 
+API_DEFAULT_PARAMS = MappingProxyType({"active": "true", "type": "watch", "ordering": "-inserted_at", "limit": 10_000})
+
 
 class BigBrother(WatchChannel, Cog, name="Big Brother"):
     """Monitors users by relaying their messages to a watch channel to assist with moderation."""
@@ -22,7 +24,7 @@ class BigBrother(WatchChannel, Cog, name="Big Brother"):
             destination=Channels.big_brother,
             webhook_id=Webhooks.big_brother.id,
             api_endpoint="bot/infractions",
-            api_default_params={"active": "true", "type": "watch", "ordering": "-inserted_at", "limit": 10_000},
+            api_default_params=API_DEFAULT_PARAMS,
             logger=log
         )
 
@@ -86,7 +88,10 @@ class BigBrother(WatchChannel, Cog, name="Big Brother"):
             await ctx.send(f":x: I'm sorry {ctx.author}, I'm afraid I can't do that. I only watch humans.")
             return
 
-        if not await self.fetch_user_cache():
+        # A recent cache can be trusted when it says the user is already watched,
+        # but always check with the API before posting a new watch.
+        cached_hit = self.user_cache_is_fresh and user.id in self.watched_users
+        if not cached_hit and not await self.fetch_user_cache():
             await ctx.send(f":x: Updating the user cache failed, can't watch user {user.mention}")
             return
 
@@ -134,10 +139,7 @@ class BigBrother(WatchChannel, Cog, name="Big Brother"):
         """
         active_watches = await self.bot.api_client.get(
             self.api_endpoint,
-            params=ChainMap(
-                {"user__id": str(user.id)},
-                self.api_default_params,
-            )
+            params={**self.api_default_params, "user__id": str(user.id)}
         )
         if active_watches:
             log.trace("Active watches for user found.  Attempting to remove.")
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from redis import RedisError
+
+from bot.exts.moderation import defcon
+from bot.utils.time import parse_duration_string
+from tests.base import RedisTestCase
+from tests.helpers import MockBot, MockTextChannel, MockUser, autospec
+
+
+class DefconStringifyTests(unittest.TestCase):
+    """Tests for converting DEFCON thresholds to the strings stored in Redis."""
+
+    def test_stringified_threshold_round_trips(self):
+        """A stringified threshold parses back to the same relativedelta."""
+        test_cases = (
+            relativedelta(minutes=45),
+            relativedelta(days=1, minutes=30),
+            relativedelta(months=2, days=3),
+            relativedelta(years=1, months=6, hours=5, minutes=1, seconds=2),
+        )
+
+        for delta in test_cases:
+            with self.subTest(delta=delta):
+                self.assertEqual(parse_duration_string(defcon.Defcon._stringify_relativedelta(delta)), delta)
+
+
+class DefconUpdateThresholdTests(RedisTestCase):
+    """Tests for updating the DEFCON threshold."""
+
+    @autospec(defcon, "Scheduler", pass_mocks=False)
+    def setUp(self) -> None:
+        self.bot = MockBot()
+        self.cog = defcon.Defcon(self.bot)
+        self.cog.channel = MockTextChannel()
+        self.author = MockUser()
+        self.ctx_channel = MockTextChannel()
+
+        self.cog._update_notifier = mock.Mock()
+        self.cog._update_channel_topic = mock.AsyncMock()
+        self.cog._send_defcon_log = mock.AsyncMock()
+
+    @mock.patch.object(defcon.Defcon.defcon_settings, "update", new_callable=mock.AsyncMock)
+    async def test_unchanged_threshold_is_skipped(self, update):
+        """Setting the threshold it already has doesn't write to Redis or announce the update again."""
+        threshold = relativedelta(days=1)
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, threshold)
+        update.assert_awaited_once()
+        self.ctx_channel.send.reset_mock()
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, threshold)
+        update.assert_awaited_once()
+        self.ctx_channel.send.assert_awaited_once_with(":x: DEFCON is already set to that threshold.")
+
+    @mock.patch.object(defcon.Defcon.defcon_settings, "update", new_callable=mock.AsyncMock)
+    async def test_unchanged_threshold_is_retried_after_failed_write(self, update):
+        """Setting the same threshold again after the Redis write failed writes it again."""
+        update.side_effect = (RedisError, None)
+        threshold = relativedelta(days=1)
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, threshold)
+        self.assertIn("but failed to write to cache", self.cog.channel.send.call_args.args[0])
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, threshold)
+        self.assertEqual(update.await_count, 2)
+        self.assertNotIn("but failed to write to cache", self.cog.channel.send.call_args.args[0])
+
+    @mock.patch.object(defcon.Defcon.defcon_settings, "update", new_callable=mock.AsyncMock)
+    async def test_pending_topic_edit_is_cancelled_when_threshold_is_reverted(self, update):
+        """Reverting the threshold while its topic edit is pending cancels that edit and sends the reverted topic."""
+        del self.cog._update_channel_topic
+        self.cog.get_mod_log = mock.AsyncMock()
+        self.cog._channel_topic = self.cog._topic
+        reverted_topic = self.cog._topic
+
+        edit_started = asyncio.Event()
+
+        async def ratelimited_edit(**_kwargs):
+            edit_started.set()
+            await asyncio.Event().wait()
+
+        self.cog.channel.edit.side_effect = ratelimited_edit
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, relativedelta(days=1))
+        pending_edit = self.cog._topic_task
+        await edit_started.wait()
+
+        await self.cog._update_threshold(self.author, self.ctx_channel, defcon.ZERO_THRESHOLD)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await pending_edit
+        self.assertIsNot(self.cog._topic_task, pending_edit)
+        await asyncio.sleep(0)
+        self.cog.channel.edit.assert_called_with(topic=reverted_topic)